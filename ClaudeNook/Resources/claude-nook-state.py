@@ -4,22 +4,34 @@ Claude Nook Hook
 - Sends session state to Claude Nook.app via Unix socket (local) or TCP (remote)
 - For PermissionRequest: waits for user decision from the app
 - Supports dual-mode: Unix socket for local, TCP for remote connections
-- Supports Bonjour/mDNS auto-discovery of Claude Nook servers
 - Auto-trusts Tailscale connections (no token required for 100.x.x.x)
 
 Environment Variables:
   CLAUDE_NOOK_MODE     - Connection mode: "auto" (default), "socket", or "tcp"
-  CLAUDE_NOOK_HOST     - TCP host (default: auto-discover via Bonjour)
+  CLAUDE_NOOK_HOST     - TCP host (default: 127.0.0.1)
   CLAUDE_NOOK_PORT     - TCP port (default: 4851)
   CLAUDE_NOOK_TOKEN    - Auth token for TCP connections (optional for Tailscale)
   CLAUDE_NOOK_TIMEOUT  - Timeout in seconds (default: 300)
   CLAUDE_NOOK_DEBUG    - Set to "1" for debug output to stderr
 """
+import functools
 import json
 import os
-import socket
-import subprocess
 import sys
+import time
+
+# Prefer orjson (bytes in/out, much faster on large tool_input payloads)
+# but keep the hook dependency-free by falling back to the stdlib
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
 
 
 def is_tailscale_ip(ip):
@@ -38,29 +50,39 @@ def is_tailscale_ip(ip):
         return False
 
 
-def discover_via_bonjour(timeout=2):
-    """
-    Discover Claude Nook servers via Bonjour/mDNS.
-    Returns (host, port) tuple or (None, None) if not found.
-    """
+# Resolved TCP address, shared across hook invocations for a short while
+RESOLVED_CACHE_PATH = os.path.expanduser("~/.cache/claude-nook/resolved")
+RESOLVED_CACHE_TTL = 300  # seconds
+
+# Handshake the TCP server speaks, learned with a HELLO probe: remote hooks are
+# often updated before the app, which may predate HELLO
+PROTOCOL_CACHE_PATH = os.path.expanduser("~/.cache/claude-nook/protocol")
+PROTOCOL_CACHE_TTL = 300  # seconds
+
+
+def read_cache(path, ttl):
+    """Load a small JSON cache entry, or None if missing, invalid or expired"""
     try:
-        # Use dns-sd to browse for _claudenook._tcp services
-        # Run with timeout and parse output
-        result = subprocess.run(
-            ["dns-sd", "-B", "_claudenook._tcp", "local."],
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
-        # dns-sd -B doesn't give us host/port directly, need to resolve
-        # For simplicity, let's use dns-sd -L to lookup
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+        with open(path, "rb") as f:
+            cached = _loads(f.read())
+        if time.time() - cached["time"] < ttl:
+            return cached
+    except (OSError, ValueError, KeyError, TypeError):
         pass
+    return None
+
 
-    # Try using python's socket to do mDNS query (simpler approach)
-    # Actually, let's just try the avahi-browse or dns-sd approach
-    # For now, return None and rely on explicit config or Tailscale trust
-    return None, None
+def write_cache(path, entry):
+    """Atomically replace a small JSON cache entry; failures are ignored"""
+    entry["time"] = time.time()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
 
 class ConnectionConfig:
@@ -74,22 +96,59 @@ class ConnectionConfig:
         self.mode = os.environ.get("CLAUDE_NOOK_MODE", "auto")  # auto, socket, tcp
         self.timeout = int(os.environ.get("CLAUDE_NOOK_TIMEOUT", "300"))
         self.debug = os.environ.get("CLAUDE_NOOK_DEBUG", "0") == "1"
-        self._discovered_host = None
-        self._discovery_attempted = False
+        self._resolved_addr = None
 
     def get_host(self):
-        """Get host, attempting Bonjour discovery if not configured"""
-        if self.host:
-            return self.host
-        if not self._discovery_attempted:
-            self._discovery_attempted = True
-            discovered_host, discovered_port = discover_via_bonjour()
-            if discovered_host:
-                self._discovered_host = discovered_host
-                if discovered_port:
-                    self.port = discovered_port
-                self.log(f"Discovered Claude Nook at {discovered_host}:{self.port}")
-        return self._discovered_host or "127.0.0.1"
+        """Get host, defaulting to localhost if not configured"""
+        return self.host or "127.0.0.1"
+
+    def get_addr(self):
+        """Get the (ip, port) to connect to, resolving the host at most once"""
+        if self._resolved_addr is None:
+            self._resolved_addr = self._resolve_addr(self.get_host())
+        return self._resolved_addr
+
+    def forget_addr(self):
+        """Drop the cached address (e.g. after a failed connect)"""
+        self._resolved_addr = None
+        try:
+            os.remove(RESOLVED_CACHE_PATH)
+        except OSError:
+            pass
+
+    def _resolve_addr(self, host):
+        import socket
+
+        try:
+            socket.inet_aton(host)
+            return (host, self.port)  # Already an IPv4 address
+        except OSError:
+            pass
+
+        cached = read_cache(RESOLVED_CACHE_PATH, RESOLVED_CACHE_TTL)
+        if cached and cached.get("host") == host and cached.get("port") == self.port:
+            return (cached["ip"], self.port)
+
+        ip = socket.getaddrinfo(host, self.port, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+        self.log(f"Resolved {host} to {ip}")
+        write_cache(RESOLVED_CACHE_PATH, {"host": host, "port": self.port, "ip": ip})
+        return (ip, self.port)
+
+    def get_protocol(self):
+        """Get the handshake the server was last seen to speak, or None if unknown
+
+        "hello": current servers (HELLO, payload pipelined with the opening line)
+        "legacy": older servers that auto-trust us and take the payload straight away
+        "legacy-auth": older servers that want AUTH and an OK before the payload
+        """
+        cached = read_cache(PROTOCOL_CACHE_PATH, PROTOCOL_CACHE_TTL)
+        if cached and cached.get("host") == self.get_host() and cached.get("port") == self.port:
+            return cached.get("protocol")
+        return None
+
+    def set_protocol(self, protocol):
+        """Remember the handshake the server speaks"""
+        write_cache(PROTOCOL_CACHE_PATH, {"host": self.get_host(), "port": self.port, "protocol": protocol})
 
     def log(self, message):
         """Log debug message to stderr if debug mode is enabled"""
@@ -101,145 +160,263 @@ class ConnectionConfig:
 config = ConnectionConfig()
 
 
+def tty_from_proc(pid):
+    """Resolve a process's controlling TTY from /proc/<pid>/stat (Linux)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+        # comm (field 2) may contain spaces, so split after its closing paren;
+        # tty_nr is field 7 overall, the 5th field after comm
+        tty_nr = int(stat.rsplit(")", 1)[1].split()[4])
+    except (OSError, ValueError, IndexError):
+        return None
+    if tty_nr == 0:
+        return None
+
+    major, minor = os.major(tty_nr), os.minor(tty_nr)
+    for directory in ("/dev/pts", "/dev"):
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            continue
+        for name in names:
+            if directory == "/dev" and not name.startswith("tty"):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                rdev = os.stat(path).st_rdev
+            except OSError:
+                continue
+            if os.major(rdev) == major and os.minor(rdev) == minor:
+                return path
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def get_tty():
-    """Get the TTY of the Claude process (parent)"""
-    import subprocess
+    """Get the TTY of the Claude process (parent), resolved once per process"""
+    # The hook inherits Claude's controlling terminal in nearly all cases,
+    # so check our own descriptors before forking anything
+    for fd in (0, 1, 2):
+        try:
+            return os.ttyname(fd)
+        except OSError:
+            pass
 
     # Get parent PID (Claude process)
     ppid = os.getppid()
 
-    # Try to get TTY from ps command for the parent process
+    if sys.platform.startswith("linux"):
+        tty = tty_from_proc(ppid)
+        if tty:
+            return tty
+
+    # Last resort: ask ps for the parent's TTY
+    import subprocess
+
     try:
         result = subprocess.run(
             ["ps", "-p", str(ppid), "-o", "tty="],
             capture_output=True,
             text=True,
-            timeout=2
+            timeout=0.5
         )
         tty = result.stdout.strip()
-        if tty and tty != "??" and tty != "-":
+        if tty and tty not in ("?", "??", "-"):
             # ps returns just "ttys001", we need "/dev/ttys001"
             if not tty.startswith("/dev/"):
                 tty = "/dev/" + tty
             return tty
-    except Exception:
+    except (subprocess.SubprocessError, OSError, ValueError):
         pass
+    return None
 
-    # Fallback: try current process stdin/stdout
-    try:
-        return os.ttyname(sys.stdin.fileno())
-    except (OSError, AttributeError):
-        pass
-    try:
-        return os.ttyname(sys.stdout.fileno())
-    except (OSError, AttributeError):
-        pass
+
+def recv_line(sock, bufsize=256):
+    """Read a newline-terminated server reply, normally in a single recv.
+
+    Returns None if the connection closes before the line is complete.
+    """
+    chunk = sock.recv(bufsize)
+    if b"\n" in chunk:
+        return chunk
+    chunks = []
+    while chunk:
+        chunks.append(chunk)
+        if b"\n" in chunk:
+            return b"".join(chunks)
+        chunk = sock.recv(bufsize)
     return None
 
 
+def recv_response(sock):
+    """Read the reply to a permission request, skipping an OK line the server
+    may send first when it didn't see the payload in the handshake read"""
+    response = sock.recv(4096)
+    while response.startswith(b"OK\n"):
+        response = response[3:] or sock.recv(4096)
+    return response
+
+
 def send_via_socket(state, wait_for_response=False):
     """Send event via Unix domain socket (local connections)"""
+    import socket
+
     try:
         config.log(f"Connecting via Unix socket: {config.socket_path}")
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(config.timeout)
-        sock.connect(config.socket_path)
-        sock.sendall(json.dumps(state).encode())
-
-        if wait_for_response:
-            config.log("Waiting for response...")
-            response = sock.recv(4096)
-            sock.close()
-            if response:
-                config.log(f"Received response: {response.decode()}")
-                return json.loads(response.decode())
-        else:
-            sock.close()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            # macOS defaults AF_UNIX stream sockets to an 8KB send buffer; raise it
+            # so typical payloads go to the kernel in a single copy
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+            sock.settimeout(config.timeout)
+            sock.connect(config.socket_path)
+
+            # One write(2) on the raw fd usually moves the whole payload; finish
+            # with sendall only on a short write (the timeout makes the fd
+            # non-blocking, so a payload beyond SO_SNDBUF can come up short)
+            payload = _dumps(state)
+            try:
+                written = os.write(sock.fileno(), payload)
+            except BlockingIOError:
+                written = 0
+            if written < len(payload):
+                sock.sendall(memoryview(payload)[written:])
+
+            if wait_for_response:
+                config.log("Waiting for response...")
+                response = sock.recv(4096)
+                if response:
+                    if config.debug:
+                        config.log(f"Received response: {response.decode(errors='replace')}")
+                    try:
+                        return _loads(response)
+                    except json.JSONDecodeError as e:
+                        config.log(f"JSON decode error: {e}")
+                        return None
 
         config.log("Socket send successful")
         return None
     except FileNotFoundError:
         config.log(f"Socket not found: {config.socket_path}")
         return None
-    except (socket.error, OSError) as e:
+    except OSError as e:
         config.log(f"Socket error: {e}")
         return None
-    except json.JSONDecodeError as e:
-        config.log(f"JSON decode error: {e}")
-        return None
+
+
+def connect_tcp():
+    """Open a TCP connection to the configured server"""
+    import socket
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        # Small request/reply messages: don't let Nagle hold them back
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(config.timeout)
+        sock.connect(config.get_addr())
+    except OSError:
+        sock.close()
+        # The cached address may be stale; resolve again next time
+        config.forget_addr()
+        raise
+    return sock
+
+
+def probe_protocol(sock):
+    """Open with HELLO to learn which handshake the server speaks
+
+    Current servers echo it (HELLO OK / HELLO AUTH_REQUIRED) and the connection
+    stays usable. Older ones reply OK if they auto-trust us and ERR otherwise,
+    having taken HELLO for the payload or an AUTH line. Returns
+    (protocol, reply), or (None, None) if the connection closes first.
+    """
+    sock.sendall(b"HELLO\n")
+    reply = recv_line(sock)
+    if reply is None:
+        return None, None
+    reply = reply.strip()
+    if reply.startswith(b"HELLO "):
+        return "hello", reply
+    return ("legacy" if reply == b"OK" else "legacy-auth"), reply
 
 
 def send_via_tcp(state, wait_for_response=False):
     """Send event via TCP with authentication (remote connections)
 
-    Supports Tailscale auto-trust: if connecting to a Tailscale IP and the server
-    trusts Tailscale connections, it will send OK immediately without requiring auth.
+    With a token, the AUTH line and payload go out in a single write. Without
+    one, the connection opens with HELLO; the server answers HELLO OK if it
+    auto-trusts us (Tailscale) or HELLO AUTH_REQUIRED otherwise. Servers that
+    predate HELLO get the older sequential handshake instead.
     """
+    import socket
+
     host = config.get_host()
 
     try:
         config.log(f"Connecting via TCP: {host}:{config.port}")
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(config.timeout)
-        sock.connect((host, config.port))
-
-        # Check if server auto-trusts us (Tailscale) by waiting briefly for OK
-        # Set a short timeout to check for immediate OK
-        sock.settimeout(0.5)
-        auto_trusted = False
+        payload = _dumps(state)
+        protocol = config.get_protocol()
+        sock = connect_tcp()
         try:
-            initial_response = sock.recv(64)
-            if initial_response and initial_response.decode().strip() == "OK":
-                config.log("Auto-trusted by server (Tailscale)")
-                auto_trusted = True
-        except socket.timeout:
-            # No immediate response - need to authenticate
-            pass
-
-        sock.settimeout(config.timeout)
-
-        if not auto_trusted:
-            # Need to send authentication
-            if not config.token:
-                config.log("TCP mode requires CLAUDE_NOOK_TOKEN (not auto-trusted)")
-                sock.close()
-                return None
-
-            # Send authentication header
-            auth_line = f"AUTH {config.token}\n"
-            config.log("Sending auth...")
-            sock.sendall(auth_line.encode())
-
-            # Wait for auth response
-            auth_response = b""
-            while b"\n" not in auth_response:
-                chunk = sock.recv(64)
-                if not chunk:
-                    config.log("Connection closed during auth")
-                    sock.close()
+            reply = None
+            # Without a token, only send a permission request once the server
+            # says it trusts us; the probe doubles as that handshake
+            if protocol is None or (protocol == "hello" and not config.token and wait_for_response):
+                protocol, reply = probe_protocol(sock)
+                if protocol is None:
+                    config.log("Connection closed during handshake")
                     return None
-                auth_response += chunk
-
-            auth_result = auth_response.decode().strip()
-            config.log(f"Auth response: {auth_result}")
-
-            if auth_result != "OK":
-                config.log(f"Authentication failed: {auth_result}")
-                sock.close()
-                return None
-
-        # Send JSON payload
-        config.log("Sending event payload...")
-        sock.sendall(json.dumps(state).encode())
+                config.log(f"Server protocol: {protocol}")
+                config.set_protocol(protocol)
+                if protocol != "hello":
+                    # The older server took HELLO as the start of a request
+                    sock.close()
+                    sock = connect_tcp()
 
-        if wait_for_response:
-            config.log("Waiting for response...")
-            response = sock.recv(4096)
-            sock.close()
-            if response:
-                config.log(f"Received response: {response.decode()}")
-                return json.loads(response.decode())
-        else:
+            config.log("Sending event payload...")
+            if reply == b"HELLO OK":
+                config.log("Auto-trusted by server (Tailscale)")
+                sock.sendall(payload)
+            elif protocol == "hello":
+                if reply is not None and not config.token:
+                    config.log("TCP mode requires CLAUDE_NOOK_TOKEN (not auto-trusted)")
+                    return None
+                # Send the opening line and payload in one write, so the short
+                # line never goes out as a packet of its own. The server doesn't
+                # reply to a pipelined payload, and drops it if auth fails.
+                first_line = f"AUTH {config.token}\n".encode() if config.token else b"HELLO\n"
+                sock.sendall(first_line + payload)
+            elif protocol == "legacy":
+                # Older servers that trust us read the payload without a handshake
+                # line (any OK they send first is skipped with the response)
+                sock.sendall(payload)
+            else:
+                if not config.token:
+                    config.log("TCP mode requires CLAUDE_NOOK_TOKEN (not auto-trusted)")
+                    return None
+                # Older servers drop anything sent along with the AUTH line
+                sock.sendall(f"AUTH {config.token}\n".encode())
+                auth_response = recv_line(sock)
+                if auth_response is None or auth_response.strip() != b"OK":
+                    config.log(f"Authentication failed: {auth_response!r}")
+                    return None
+                sock.sendall(payload)
+
+            if wait_for_response:
+                config.log("Waiting for response...")
+                response = recv_response(sock)
+                if response:
+                    if config.debug:
+                        config.log(f"Received response: {response.decode(errors='replace')}")
+                    if response.startswith(b"ERR"):
+                        # e.g. "ERR: Invalid token" in reply to the pipelined AUTH line
+                        return None
+                    try:
+                        return _loads(response)
+                    except json.JSONDecodeError as e:
+                        config.log(f"JSON decode error: {e}")
+                        return None
+        finally:
             sock.close()
 
         config.log("TCP send successful")
@@ -250,12 +427,9 @@ def send_via_tcp(state, wait_for_response=False):
     except ConnectionRefusedError:
         config.log(f"TCP connection refused to {host}:{config.port}")
         return None
-    except (socket.error, OSError) as e:
+    except OSError as e:
         config.log(f"TCP error: {e}")
         return None
-    except json.JSONDecodeError as e:
-        config.log(f"JSON decode error: {e}")
-        return None
 
 
 def send_event(state, wait_for_response=False):
@@ -292,60 +466,90 @@ def send_event(state, wait_for_response=False):
         return result
 
 
+def tool_fields(data):
+    """Tool details, plus tool_use_id so Swift can cache it (PreToolUse)
+    and cancel the specific pending permission (PostToolUse)"""
+    fields = {"tool": data.get("tool_name"), "tool_input": data.get("tool_input", {})}
+    tool_use_id = data.get("tool_use_id")
+    if tool_use_id:
+        fields["tool_use_id"] = tool_use_id
+    return fields
+
+
+def permission_fields(data):
+    """Tool details (tool_use_id lookup handled by Swift-side cache from PreToolUse)"""
+    return {"tool": data.get("tool_name"), "tool_input": data.get("tool_input", {})}
+
+
+def notification_fields(data):
+    """Notification details; idle prompts mean Claude is waiting for input"""
+    notification_type = data.get("notification_type")
+    fields = {"notification_type": notification_type, "message": data.get("message")}
+    if notification_type == "idle_prompt":
+        fields["status"] = "waiting_for_input"
+    return fields
+
+
+# Map events to (status, extra_fields_fn); extra fields may override status
+EVENT_HANDLERS = {
+    # User just sent a message - Claude is now processing
+    "UserPromptSubmit": ("processing", None),
+    "PreToolUse": ("running_tool", tool_fields),
+    "PostToolUse": ("processing", tool_fields),
+    # This is where we can control the permission
+    "PermissionRequest": ("waiting_for_approval", permission_fields),
+    "Notification": ("notification", notification_fields),
+    "Stop": ("waiting_for_input", None),
+    # SubagentStop fires when a subagent completes - usually means back to waiting
+    "SubagentStop": ("waiting_for_input", None),
+    # New session starts waiting for user input
+    "SessionStart": ("waiting_for_input", None),
+    "SessionEnd": ("ended", None),
+    # Context is being compacted (manual or auto)
+    "PreCompact": ("compacting", None),
+}
+UNKNOWN_EVENT = ("unknown", None)
+
+# Hook output for PermissionRequest decisions; the deny message is spliced in
+ALLOW_OUTPUT = (
+    '{"hookSpecificOutput":{"hookEventName":"PermissionRequest",'
+    '"decision":{"behavior":"allow"}}}'
+)
+DENY_OUTPUT_TEMPLATE = (
+    '{"hookSpecificOutput":{"hookEventName":"PermissionRequest",'
+    '"decision":{"behavior":"deny","message":%s}}}'
+)
+
+
 def main():
+    # Parse raw bytes: orjson works on them directly, skipping text-mode decoding
     try:
-        data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+        data = _loads(sys.stdin.buffer.read())
+    except ValueError:  # includes json/orjson JSONDecodeError
         sys.exit(1)
 
-    session_id = data.get("session_id", "unknown")
     event = data.get("hook_event_name", "")
-    cwd = data.get("cwd", "")
-    tool_input = data.get("tool_input", {})
 
-    # Get process info
-    claude_pid = os.getppid()
-    tty = get_tty()
+    # Skip permission_prompt - PermissionRequest hook handles this with better info
+    if event == "Notification" and data.get("notification_type") == "permission_prompt":
+        sys.exit(0)
+
+    status, extra_fields = EVENT_HANDLERS.get(event, UNKNOWN_EVENT)
 
-    # Build state object
+    # Build state object (tty is resolved only now, so events that bail
+    # out early never pay for the lookup)
     state = {
-        "session_id": session_id,
-        "cwd": cwd,
+        "session_id": data.get("session_id", "unknown"),
+        "cwd": data.get("cwd", ""),
         "event": event,
-        "pid": claude_pid,
-        "tty": tty,
+        "pid": os.getppid(),
+        "tty": get_tty(),
+        "status": status,
     }
+    if extra_fields:
+        state.update(extra_fields(data))
 
-    # Map events to status
-    if event == "UserPromptSubmit":
-        # User just sent a message - Claude is now processing
-        state["status"] = "processing"
-
-    elif event == "PreToolUse":
-        state["status"] = "running_tool"
-        state["tool"] = data.get("tool_name")
-        state["tool_input"] = tool_input
-        # Send tool_use_id to Swift for caching
-        tool_use_id_from_event = data.get("tool_use_id")
-        if tool_use_id_from_event:
-            state["tool_use_id"] = tool_use_id_from_event
-
-    elif event == "PostToolUse":
-        state["status"] = "processing"
-        state["tool"] = data.get("tool_name")
-        state["tool_input"] = tool_input
-        # Send tool_use_id so Swift can cancel the specific pending permission
-        tool_use_id_from_event = data.get("tool_use_id")
-        if tool_use_id_from_event:
-            state["tool_use_id"] = tool_use_id_from_event
-
-    elif event == "PermissionRequest":
-        # This is where we can control the permission
-        state["status"] = "waiting_for_approval"
-        state["tool"] = data.get("tool_name")
-        state["tool_input"] = tool_input
-        # tool_use_id lookup handled by Swift-side cache from PreToolUse
-
+    if event == "PermissionRequest":
         # Send to app and wait for decision
         response = send_event(state, wait_for_response=True)
 
@@ -355,65 +559,18 @@ def main():
 
             if decision == "allow":
                 # Output JSON to approve
-                output = {
-                    "hookSpecificOutput": {
-                        "hookEventName": "PermissionRequest",
-                        "decision": {"behavior": "allow"},
-                    }
-                }
-                print(json.dumps(output))
+                sys.stdout.write(ALLOW_OUTPUT)
                 sys.exit(0)
 
             elif decision == "deny":
-                # Output JSON to deny
-                output = {
-                    "hookSpecificOutput": {
-                        "hookEventName": "PermissionRequest",
-                        "decision": {
-                            "behavior": "deny",
-                            "message": reason or "Denied by user via Claude Nook",
-                        },
-                    }
-                }
-                print(json.dumps(output))
+                # Output JSON to deny (only the message needs escaping)
+                message = reason or "Denied by user via Claude Nook"
+                sys.stdout.write(DENY_OUTPUT_TEMPLATE % json.dumps(message))
                 sys.exit(0)
 
         # No response or "ask" - let Claude Code show its normal UI
         sys.exit(0)
 
-    elif event == "Notification":
-        notification_type = data.get("notification_type")
-        # Skip permission_prompt - PermissionRequest hook handles this with better info
-        if notification_type == "permission_prompt":
-            sys.exit(0)
-        elif notification_type == "idle_prompt":
-            state["status"] = "waiting_for_input"
-        else:
-            state["status"] = "notification"
-        state["notification_type"] = notification_type
-        state["message"] = data.get("message")
-
-    elif event == "Stop":
-        state["status"] = "waiting_for_input"
-
-    elif event == "SubagentStop":
-        # SubagentStop fires when a subagent completes - usually means back to waiting
-        state["status"] = "waiting_for_input"
-
-    elif event == "SessionStart":
-        # New session starts waiting for user input
-        state["status"] = "waiting_for_input"
-
-    elif event == "SessionEnd":
-        state["status"] = "ended"
-
-    elif event == "PreCompact":
-        # Context is being compacted (manual or auto)
-        state["status"] = "compacting"
-
-    else:
-        state["status"] = "unknown"
-
     # Send to socket (fire and forget for non-permission events)
     send_event(state)
 
@@ -15,6 +15,7 @@ struct HookInstaller {
             .appendingPathComponent(".claude")
         let hooksDir = claudeDir.appendingPathComponent("hooks")
         let pythonScript = hooksDir.appendingPathComponent("claude-nook-state.py")
+        let compiledHook = hooksDir.appendingPathComponent("claude-nook-state")
         let settings = claudeDir.appendingPathComponent("settings.json")
 
         try? FileManager.default.createDirectory(
@@ -31,18 +32,70 @@ struct HookInstaller {
             )
         }
 
-        updateSettings(at: settings)
+        // Prefer the compiled hook (built by scripts/build-hook.sh) when bundled,
+        // since it skips Python interpreter startup on every event
+        try? FileManager.default.removeItem(at: compiledHook)
+        var useCompiledHook = false
+        if let bundled = Bundle.main.url(forResource: "claude-nook-state", withExtension: nil),
+           (try? FileManager.default.copyItem(at: bundled, to: compiledHook)) != nil {
+            try? FileManager.default.setAttributes(
+                [.posixPermissions: 0o755],
+                ofItemAtPath: compiledHook.path
+            )
+            useCompiledHook = compiledHookRuns(at: compiledHook)
+            if !useCompiledHook {
+                try? FileManager.default.removeItem(at: compiledHook)
+            }
+        }
+
+        updateSettings(at: settings, useCompiledHook: useCompiledHook)
+    }
+
+    /// Whether the compiled hook can run on this Mac: Nuitka only builds for the
+    /// build machine's architecture, while the app itself is universal
+    private static func compiledHookRuns(at hookURL: URL) -> Bool {
+        let process = Process()
+        process.executableURL = hookURL
+        process.standardInput = FileHandle.nullDevice
+        process.standardOutput = FileHandle.nullDevice
+        process.standardError = FileHandle.nullDevice
+
+        do {
+            try process.run()
+            process.waitUntilExit()
+            // Empty input is rejected with status 1 before the hook sends anything
+            return process.terminationReason == .exit && process.terminationStatus == 1
+        } catch {
+            return false
+        }
     }
 
-    private static func updateSettings(at settingsURL: URL) {
+    /// Whether a hook command runs our hook (compiled binary or Python script)
+    private static func isOurHookCommand(_ command: String) -> Bool {
+        command.contains("claude-nook-state")
+    }
+
+    /// Commands exactly as this installer writes them. Only these are switched
+    /// between the compiled hook and the script; customized ones are left alone
+    private static let generatedHookCommands: Set<String> = [
+        "~/.claude/hooks/claude-nook-state",
+        "python3 ~/.claude/hooks/claude-nook-state.py",
+        "python ~/.claude/hooks/claude-nook-state.py",
+    ]
+
+    private static func updateSettings(at settingsURL: URL, useCompiledHook: Bool) {
         var json: [String: Any] = [:]
         if let data = try? Data(contentsOf: settingsURL),
            let existing = try? JSONSerialization.jsonObject(with: data) as? [String: Any] {
             json = existing
         }
 
-        let python = detectPython()
-        let command = "\(python) ~/.claude/hooks/claude-nook-state.py"
+        let command: String
+        if useCompiledHook {
+            command = "~/.claude/hooks/claude-nook-state"
+        } else {
+            command = "\(detectPython()) ~/.claude/hooks/claude-nook-state.py"
+        }
         let hookEntry: [[String: Any]] = [["type": "command", "command": command]]
         let hookEntryWithTimeout: [[String: Any]] = [["type": "command", "command": command, "timeout": 86400]]
         let withMatcher: [[String: Any]] = [["matcher": "*", "hooks": hookEntry]]
@@ -74,15 +127,29 @@ struct HookInstaller {
                     if let entryHooks = entry["hooks"] as? [[String: Any]] {
                         return entryHooks.contains { h in
                             let cmd = h["command"] as? String ?? ""
-                            return cmd.contains("claude-nook-state.py")
+                            return isOurHookCommand(cmd)
                         }
                     }
                     return false
                 }
-                if !hasOurHook {
+                if hasOurHook {
+                    // Point entries we generated at the current hook (compiled or script)
+                    existingEvent = existingEvent.map { entry in
+                        guard let entryHooks = entry["hooks"] as? [[String: Any]] else { return entry }
+                        var updatedEntry = entry
+                        updatedEntry["hooks"] = entryHooks.map { h in
+                            var updatedHook = h
+                            if generatedHookCommands.contains(h["command"] as? String ?? "") {
+                                updatedHook["command"] = command
+                            }
+                            return updatedHook
+                        }
+                        return updatedEntry
+                    }
+                } else {
                     existingEvent.append(contentsOf: config)
-                    hooks[event] = existingEvent
                 }
+                hooks[event] = existingEvent
             } else {
                 hooks[event] = config
             }
@@ -116,7 +183,7 @@ struct HookInstaller {
                     if let entryHooks = entry["hooks"] as? [[String: Any]] {
                         for hook in entryHooks {
                             if let cmd = hook["command"] as? String,
-                               cmd.contains("claude-nook-state.py") {
+                               isOurHookCommand(cmd) {
                                 return true
                             }
                         }
@@ -133,9 +200,11 @@ struct HookInstaller {
             .appendingPathComponent(".claude")
         let hooksDir = claudeDir.appendingPathComponent("hooks")
         let pythonScript = hooksDir.appendingPathComponent("claude-nook-state.py")
+        let compiledHook = hooksDir.appendingPathComponent("claude-nook-state")
         let settings = claudeDir.appendingPathComponent("settings.json")
 
         try? FileManager.default.removeItem(at: pythonScript)
+        try? FileManager.default.removeItem(at: compiledHook)
 
         guard let data = try? Data(contentsOf: settings),
               var json = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
@@ -149,7 +218,7 @@ struct HookInstaller {
                     if let entryHooks = entry["hooks"] as? [[String: Any]] {
                         return entryHooks.contains { hook in
                             let cmd = hook["command"] as? String ?? ""
-                            return cmd.contains("claude-nook-state.py")
+                            return isOurHookCommand(cmd)
                         }
                     }
                     return false
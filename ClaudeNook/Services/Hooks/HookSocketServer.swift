@@ -617,52 +617,55 @@ class HookSocketServer {
         handleClient(clientSocket, connectionType: .tcp(address: clientIP))
     }
 
-    /// Authenticate TCP client using AUTH protocol
-    /// Tailscale IPs (100.64.0.0/10) are auto-trusted if trustTailscale is enabled
-    /// Returns (success, leftoverData) - leftover data is anything read after the AUTH line
+    /// Authenticate TCP client using HELLO/AUTH protocol
+    /// Clients open with either `HELLO\n`, answered with `HELLO OK\n` when auto-trusted or
+    /// `HELLO AUTH_REQUIRED\n` otherwise, or go straight to `AUTH <token>\n`. Echoing HELLO
+    /// lets hooks tell this server apart from older ones, which reply `OK` or `ERR` to it
+    /// Tailscale IPs (100.64.0.0/10) are auto-trusted if trustTailscale is enabled, and
+    /// may also skip the handshake and open with their request (SUBSCRIBE or a payload)
+    /// Returns (success, leftoverData) - leftover data is anything read after the handshake
     private func authenticateTCPClient(_ clientSocket: Int32, address: String) -> (success: Bool, leftover: Data?) {
-        // Check if this is a trusted Tailscale connection
-        if trustTailscale && TCPConfiguration.isTailscaleIP(address) {
+        let isTrusted = trustTailscale && TCPConfiguration.isTailscaleIP(address)
+
+        // A trusted event payload carries no trailing newline, so don't wait for a line
+        var firstByte: UInt8 = 0
+        if isTrusted && recv(clientSocket, &firstByte, 1, MSG_PEEK | MSG_DONTWAIT) == 1 && firstByte == 0x7B {  // '{'
             logger.info("TCP: Auto-trusting Tailscale connection from \(address, privacy: .public)")
-            // Send OK immediately for trusted connections
-            let okResponse = "OK\n"
-            _ = okResponse.withCString { ptr in
-                write(clientSocket, ptr, strlen(ptr))
-            }
             return (true, nil)
         }
 
-        // Read auth line (AUTH <token>\n)
-        var authBuffer = [UInt8](repeating: 0, count: 256)
-        var pollFd = pollfd(fd: clientSocket, events: Int16(POLLIN), revents: 0)
-
-        // 5 second timeout for auth
-        let pollResult = poll(&pollFd, 1, 5000)
-        guard pollResult > 0 else {
-            logger.warning("TCP: Auth timeout from \(address, privacy: .public)")
-            sendTCPError(to: clientSocket, message: "Auth timeout")
+        guard let firstLine = readTCPLine(from: clientSocket, address: address) else {
             return (false, nil)
         }
+        var authLine = firstLine.line
+        var leftover = firstLine.leftover
 
-        let bytesRead = read(clientSocket, &authBuffer, authBuffer.count)
-        guard bytesRead > 0 else {
-            logger.warning("TCP: No auth data from \(address, privacy: .public)")
-            return (false, nil)
-        }
-
-        // Parse auth line
-        guard let authString = String(bytes: authBuffer[0..<bytesRead], encoding: .utf8) else {
-            sendTCPError(to: clientSocket, message: "Invalid auth format")
-            return (false, nil)
-        }
+        if authLine == "HELLO" {
+            if isTrusted {
+                logger.info("TCP: Auto-trusting Tailscale connection from \(address, privacy: .public)")
+                if !isPayloadPipelined(after: leftover, on: clientSocket) {
+                    sendTCPLine("HELLO OK", to: clientSocket)
+                }
+                return (true, leftover.isEmpty ? nil : leftover)
+            }
 
-        // Find newline and extract auth part
-        guard let newlineIndex = authString.firstIndex(of: "\n") else {
-            sendTCPError(to: clientSocket, message: "Invalid auth format")
-            return (false, nil)
+            // Tell the client up front that it has to authenticate
+            sendTCPLine("HELLO AUTH_REQUIRED", to: clientSocket)
+            guard let next = readTCPLine(from: clientSocket, address: address, buffered: leftover) else {
+                return (false, nil)
+            }
+            authLine = next.line
+            leftover = next.leftover
+        } else if isTrusted && !authLine.hasPrefix("AUTH ") {
+            // Token-less trusted clients (iOS, watch) open with their request, e.g. SUBSCRIBE
+            logger.info("TCP: Auto-trusting Tailscale connection from \(address, privacy: .public)")
+            sendTCPLine("OK", to: clientSocket)
+            var request = Data(authLine.utf8)
+            request.append(0x0A)  // '\n'
+            request.append(leftover)
+            return (true, request)
         }
 
-        let authLine = String(authString[..<newlineIndex])
         logger.info("TCP: Received auth line (len=\(authLine.count))")
 
         let parts = authLine.split(separator: " ", maxSplits: 1)
@@ -676,31 +679,101 @@ class HookSocketServer {
 
         let receivedToken = String(parts[1])
 
-        guard receivedToken == expectedToken else {
-            logger.warning("TCP: Auth failed - token mismatch from \(address, privacy: .public)")
-            sendTCPError(to: clientSocket, message: "Invalid token")
-            return (false, nil)
+        if isTrusted {
+            logger.info("TCP: Auto-trusting Tailscale connection from \(address, privacy: .public)")
+        } else {
+            guard receivedToken == expectedToken else {
+                logger.warning("TCP: Auth failed - token mismatch from \(address, privacy: .public)")
+                sendTCPError(to: clientSocket, message: "Invalid token")
+                return (false, nil)
+            }
+            logger.info("TCP: Authenticated client from \(address, privacy: .public)")
         }
 
-        // Send OK response
-        let okResponse = "OK\n"
-        _ = okResponse.withCString { ptr in
-            write(clientSocket, ptr, strlen(ptr))
+        // Send OK response, unless the client pipelined its event payload after the
+        // handshake: it never reads the OK, and writing to it after it has closed
+        // would only draw a RST
+        if !isPayloadPipelined(after: leftover, on: clientSocket) {
+            sendTCPLine("OK", to: clientSocket)
         }
 
-        logger.info("TCP: Authenticated client from \(address, privacy: .public)")
-
         // Check for leftover data after AUTH line (e.g., SUBSCRIBE sent in same packet)
-        let afterNewline = authString.index(after: newlineIndex)
-        if afterNewline < authString.endIndex {
-            let leftoverString = String(authString[afterNewline...])
-            logger.info("TCP: Found leftover data after AUTH: '\(leftoverString.prefix(20), privacy: .public)'")
-            return (true, leftoverString.data(using: .utf8))
+        if !leftover.isEmpty {
+            logger.info("TCP: Found leftover data after AUTH: '\(String(decoding: leftover.prefix(20), as: UTF8.self), privacy: .public)'")
+            return (true, leftover)
         }
 
         return (true, nil)
     }
 
+    /// Read one newline-terminated protocol line from a TCP client (5 second timeout)
+    /// Returns the line and any bytes read past it, or nil if the client timed out,
+    /// disconnected, or sent something that isn't a short UTF-8 line
+    private func readTCPLine(
+        from clientSocket: Int32,
+        address: String,
+        buffered: Data = Data()
+    ) -> (line: String, leftover: Data)? {
+        var data = buffered
+        var buffer = [UInt8](repeating: 0, count: 256)
+
+        while true {
+            if let newlineIndex = data.firstIndex(of: 0x0A) {  // '\n'
+                guard let line = String(data: data[data.startIndex..<newlineIndex], encoding: .utf8) else {
+                    sendTCPError(to: clientSocket, message: "Invalid auth format")
+                    return nil
+                }
+                return (line, Data(data[data.index(after: newlineIndex)...]))
+            }
+
+            guard data.count < 1024 else {
+                sendTCPError(to: clientSocket, message: "Invalid auth format")
+                return nil
+            }
+
+            var pollFd = pollfd(fd: clientSocket, events: Int16(POLLIN), revents: 0)
+            guard poll(&pollFd, 1, 5000) > 0 else {
+                logger.warning("TCP: Auth timeout from \(address, privacy: .public)")
+                sendTCPError(to: clientSocket, message: "Auth timeout")
+                return nil
+            }
+
+            let bytesRead = read(clientSocket, &buffer, buffer.count)
+            guard bytesRead > 0 else {
+                logger.warning("TCP: No auth data from \(address, privacy: .public)")
+                return nil
+            }
+            data.append(contentsOf: buffer[0..<bytesRead])
+        }
+    }
+
+    /// Whether the client sent an event payload along with its handshake line, and so
+    /// won't read a reply. The payload may still be in flight when the line has been
+    /// read, so if nothing follows the line yet, briefly wait and peek at what comes next
+    private func isPayloadPipelined(after leftover: Data, on clientSocket: Int32) -> Bool {
+        let hasContent = leftover.contains { !CharacterSet.whitespacesAndNewlines.contains(UnicodeScalar($0)) }
+        if hasContent {
+            return Self.startsWithJSON(leftover)
+        }
+
+        var pollFd = pollfd(fd: clientSocket, events: Int16(POLLIN), revents: 0)
+        guard poll(&pollFd, 1, 50) > 0 else { return false }
+
+        // Peek without consuming, so the payload is still read as usual
+        var peekBuffer = [UInt8](repeating: 0, count: 64)
+        let peeked = recv(clientSocket, &peekBuffer, peekBuffer.count, MSG_PEEK)
+        guard peeked > 0 else { return false }
+        return Self.startsWithJSON(leftover + Data(peekBuffer[0..<peeked]))
+    }
+
+    /// Send a single protocol line (OK, HELLO OK, HELLO AUTH_REQUIRED) to TCP client
+    private func sendTCPLine(_ line: String, to clientSocket: Int32) {
+        let response = "\(line)\n"
+        _ = response.withCString { ptr in
+            write(clientSocket, ptr, strlen(ptr))
+        }
+    }
+
     /// Send error message to TCP client
     private func sendTCPError(to clientSocket: Int32, message: String) {
         let errorResponse = "ERR: \(message)\n"
@@ -814,20 +887,41 @@ class HookSocketServer {
         iOSConnectionManager.shared.clientCount
     }
 
+    /// Check if data is a complete JSON object. A read can stop right after a `}` inside
+    /// the payload (e.g. code in an Edit), so a matching first and last byte only decides
+    /// whether it's worth trying to parse
+    private static func isCompleteJSON(_ data: Data) -> Bool {
+        guard startsWithJSON(data) else { return false }
+        let lastNonWhitespace = data.last(where: { !CharacterSet.whitespacesAndNewlines.contains(UnicodeScalar($0)) })
+        guard lastNonWhitespace == 0x7D else { return false }  // '}'
+        return (try? JSONSerialization.jsonObject(with: data)) != nil
+    }
+
+    /// Check if the first non-whitespace byte opens a JSON object, e.g. a payload sent
+    /// after a handshake line that was followed by a blank line
+    private static func startsWithJSON(_ data: Data) -> Bool {
+        data.first(where: { !CharacterSet.whitespacesAndNewlines.contains(UnicodeScalar($0)) }) == 0x7B  // '{'
+    }
+
     private func handleClient(_ clientSocket: Int32, connectionType: ConnectionType) {
         // For TCP connections, check for PAIR command first (no auth needed)
         // then authenticate other connections
         let isRemote: Bool
         var clientAddress = ""
+        var allData = Data()
         if case .tcp(let address) = connectionType {
             isRemote = true
             clientAddress = address
 
+            // Hooks that predate HELLO wait for an unsolicited OK before sending anything
+            // to a server that trusts them, so give trusted peers only a short window
+            let isTrusted = trustTailscale && TCPConfiguration.isTailscaleIP(address)
+
             // Peek at first few bytes to check for PAIR command
             // PAIR commands don't require authentication - they're used to GET a token
             var peekBuffer = [UInt8](repeating: 0, count: 16)
             var pollFd = pollfd(fd: clientSocket, events: Int16(POLLIN), revents: 0)
-            let pollResult = poll(&pollFd, 1, 5000)
+            let pollResult = poll(&pollFd, 1, isTrusted ? 200 : 5000)
 
             if pollResult > 0 {
                 // Peek without consuming the data
@@ -852,22 +946,30 @@ class HookSocketServer {
                 }
             }
 
-            // Not a PAIR command - require authentication
-            let authResult = authenticateTCPClient(clientSocket, address: address)
-            guard authResult.success else {
-                close(clientSocket)
-                return
-            }
-
-            // Check if leftover data contains SUBSCRIBE
-            if let leftover = authResult.leftover,
-               let leftoverStr = String(data: leftover, encoding: .utf8) {
-                let trimmed = leftoverStr.trimmingCharacters(in: .whitespacesAndNewlines)
-                if trimmed == "SUBSCRIBE" {
-                    logger.info("TCP: Found SUBSCRIBE in leftover data from \(address, privacy: .public)")
-                    handleSubscribeClient(clientSocket, address: address)
+            if pollResult == 0 && isTrusted {
+                logger.info("TCP: Auto-trusting silent Tailscale connection from \(address, privacy: .public)")
+                sendTCPLine("OK", to: clientSocket)
+            } else {
+                // Not a PAIR command - require authentication
+                let authResult = authenticateTCPClient(clientSocket, address: address)
+                guard authResult.success else {
+                    close(clientSocket)
                     return
                 }
+
+                // Check if leftover data contains SUBSCRIBE
+                if let leftover = authResult.leftover {
+                    if let leftoverStr = String(data: leftover, encoding: .utf8) {
+                        let trimmed = leftoverStr.trimmingCharacters(in: .whitespacesAndNewlines)
+                        if trimmed == "SUBSCRIBE" {
+                            logger.info("TCP: Found SUBSCRIBE in leftover data from \(address, privacy: .public)")
+                            handleSubscribeClient(clientSocket, address: address)
+                            return
+                        }
+                    }
+                    // Otherwise it's the start of an event payload pipelined with the handshake
+                    allData = leftover
+                }
             }
         } else {
             isRemote = false
@@ -876,12 +978,11 @@ class HookSocketServer {
         let flags = fcntl(clientSocket, F_GETFL)
         _ = fcntl(clientSocket, F_SETFL, flags | O_NONBLOCK)
 
-        var allData = Data()
         var buffer = [UInt8](repeating: 0, count: 131072)
         var pollFd = pollfd(fd: clientSocket, events: Int16(POLLIN), revents: 0)
 
         let startTime = Date()
-        while Date().timeIntervalSince(startTime) < 0.5 {
+        while !Self.isCompleteJSON(allData) && Date().timeIntervalSince(startTime) < 0.5 {
             let pollResult = poll(&pollFd, 1, 50)
 
             if pollResult > 0 && (pollFd.revents & Int16(POLLIN)) != 0 {
@@ -904,12 +1005,8 @@ class HookSocketServer {
                         }
                     }
 
-                    // Check if data looks like complete JSON (starts with { and ends with })
-                    if allData.first == 0x7B {  // '{'
-                        if let lastNonWhitespace = allData.last(where: { !CharacterSet.whitespacesAndNewlines.contains(UnicodeScalar($0)) }),
-                           lastNonWhitespace == 0x7D {  // '}'
-                            break
-                        }
+                    if Self.isCompleteJSON(allData) {
+                        break
                     }
                 } else if bytesRead == 0 {
                     break
@@ -0,0 +1,57 @@
+#!/bin/bash
+# Compile the Claude Code hook to a native executable with Nuitka
+# The app bundles ClaudeNook/Resources/claude-nook-state when present and
+# registers it instead of the Python script (no interpreter startup per event)
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(dirname "$SCRIPT_DIR")"
+HOOK_SOURCE="$PROJECT_DIR/ClaudeNook/Resources/claude-nook-state.py"
+HOOK_BINARY="$PROJECT_DIR/ClaudeNook/Resources/claude-nook-state"
+BUILD_DIR="$PROJECT_DIR/build/hook"
+
+echo "=== Building Compiled Hook ==="
+echo ""
+
+if ! python3 -m nuitka --version >/dev/null 2>&1; then
+    echo "Nuitka not found (pip3 install nuitka) - the app will use the Python hook"
+    rm -f "$HOOK_BINARY"
+    exit 0
+fi
+
+# Binaries in Resources aren't signed by Xcode, and an unsigned one fails
+# notarization, so only bundle the hook when it can be signed here
+if [[ -z "$CODE_SIGN_IDENTITY" ]]; then
+    echo "CODE_SIGN_IDENTITY not set (Developer ID Application) - the app will use the Python hook"
+    rm -f "$HOOK_BINARY"
+    exit 0
+fi
+
+# Unpack the onefile payload once per hook version instead of on every run
+HOOK_HASH=$(shasum -a 256 "$HOOK_SOURCE" | cut -c1-12)
+
+rm -rf "$BUILD_DIR"
+mkdir -p "$BUILD_DIR"
+
+python3 -m nuitka \
+    --onefile \
+    --lto=yes \
+    --python-flag=-S \
+    --onefile-tempdir-spec="{CACHE_DIR}/claude-nook/hook-$HOOK_HASH" \
+    --output-dir="$BUILD_DIR" \
+    --output-filename=claude-nook-state \
+    --macos-sign-identity="$CODE_SIGN_IDENTITY" \
+    --macos-sign-notarization \
+    "$HOOK_SOURCE"
+
+cp "$BUILD_DIR/claude-nook-state" "$HOOK_BINARY"
+chmod 755 "$HOOK_BINARY"
+
+echo ""
+echo "Compiled hook: $HOOK_BINARY"
+if command -v hyperfine >/dev/null 2>&1; then
+    EVENT='{"session_id":"bench","hook_event_name":"Notification","notification_type":"permission_prompt"}'
+    hyperfine --warmup 3 \
+        "echo '$EVENT' | python3 '$HOOK_SOURCE'" \
+        "echo '$EVENT' | '$HOOK_BINARY'"
+fi
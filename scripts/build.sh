@@ -17,6 +17,14 @@ mkdir -p "$BUILD_DIR"
 
 cd "$PROJECT_DIR"
 
+# Compile the hook first so the archive bundles it (skipped without Nuitka).
+# It has to be signed for notarization, with the Developer ID identity the
+# export uses unless CODE_SIGN_IDENTITY says otherwise
+HOOK_SIGN_IDENTITY="${CODE_SIGN_IDENTITY:-$(security find-identity -v -p codesigning 2>/dev/null \
+    | sed -n 's/.*"\(Developer ID Application:[^"]*\)".*/\1/p' | head -1)}"
+CODE_SIGN_IDENTITY="$HOOK_SIGN_IDENTITY" "$SCRIPT_DIR/build-hook.sh"
+echo ""
+
 # Build and archive
 echo "Archiving..."
 xcodebuild archive \